@@ -12,9 +12,16 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import urllib.request
 import urllib.parse
+import urllib.error
+import http.client
 import subprocess
 import shutil
 import re
+import gzip
+import calendar
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 
 try:
     from simple_term_menu import TerminalMenu
@@ -24,6 +31,118 @@ except ImportError:
     print("💡 For better interactive menus, install: pip3 install simple-term-menu")
     print()
 
+try:
+    import urllib3
+    POOLED_HTTP = True
+except ImportError:
+    POOLED_HTTP = False
+
+# Dropped connections, timeouts and truncated bodies - worth re-requesting the rest of a range
+RETRYABLE_ERRORS = (OSError, http.client.HTTPException)
+if POOLED_HTTP:
+    RETRYABLE_ERRORS += (urllib3.exceptions.HTTPError,)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads  # Accepts bytes too, so callers never need to decode
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import zoneinfo
+    LONDON_TZ = zoneinfo.ZoneInfo('Europe/London')
+except ImportError:
+    LONDON_TZ = None  # Python < 3.9 without zoneinfo
+except zoneinfo.ZoneInfoNotFoundError:
+    LONDON_TZ = None  # No system tz database and no tzdata package
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+API_CACHE_TTL = 300  # Seconds to reuse category/stream listings before refetching
+RECENT_CATEGORIES = 4  # Recently used categories whose streams are prefetched
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # Direct downloads read and write in 1 MB blocks
+PROGRESS_INTERVAL = 0.1  # Seconds between progress line redraws (10 Hz)
+DOWNLOAD_RETRIES = 3  # Attempts to re-request a range after the connection drops
+MAX_DOWNLOAD_CONNECTIONS = 8  # Upper bound for download_connections in config.json
+
+# 24h time as HHMM, HH:MM, HMM or H:MM
+TIME_RE = re.compile(r'(\d{1,2}):?(\d{2})')
+
+# Filename sanitizing in one pass: invalid characters become _, control characters are dropped
+SANITIZE_TABLE = str.maketrans({
+    **{c: '_' for c in '<>:"/\\|?*'},
+    **{chr(c): None for c in [*range(32), 127]},
+})
+
+
+def _find_clipboard_command():
+    """Pick the clipboard tool once: pbcopy on macOS, else the first one installed on Linux"""
+    if sys.platform == 'darwin':
+        return ['pbcopy']
+    for cmd in (['xclip', '-selection', 'clipboard'], ['xsel', '--clipboard', '--input'], ['wl-copy']):
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+CLIPBOARD_CMD = _find_clipboard_command()
+
+
+def _write_all(f, data):
+    """Write every byte of data to an unbuffered file — raw writes may be short"""
+    while data:
+        data = data[f.write(data):]
+
+
+def _pwrite_all(fd, data, offset):
+    """os.pwrite every byte of data at offset, looping on short writes"""
+    while data:
+        written = os.pwrite(fd, data, offset)
+        data = data[written:]
+        offset += written
+
+
+def _run_in_background(fn, *args, **kwargs):
+    """Run fn on a daemon thread and return a Future — unlike executor workers, it never holds up exit"""
+    future = Future()
+
+    def worker():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+
+def _file_size(path):
+    """Size of a file in bytes, 0 if it does not exist — one stat() instead of exists + getsize"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=512)
+def _is_bst_hour(year, month, day, hour):
+    """Cached London DST lookup — the offset only ever changes on the hour"""
+    return datetime(year, month, day, hour, tzinfo=LONDON_TZ).dst().total_seconds() != 0
+
+
+@lru_cache(maxsize=16)
+def _bst_bounds(year):
+    """BST start/end in UK local time: 01:00 GMT on the last Sundays of March and October"""
+    def last_sunday(month):
+        last = datetime(year, month, 31)
+        return last - timedelta(days=(last.weekday() + 1) % 7)
+    # 01:xx does not exist on the March change and is still BST on the October one
+    return last_sunday(3).replace(hour=2), last_sunday(10).replace(hour=2)
+
 
 class CatchupGenerator:
 
@@ -36,13 +155,23 @@ class CatchupGenerator:
             self.config_file = os.path.join(script_dir, config_file)
             self.cache_file = os.path.join(script_dir, ".catchup_cache.json")
             self.resume_file = os.path.join(script_dir, ".catchup_resume.json")
+            self.api_cache_file = os.path.join(script_dir, ".catchup_api_cache.json")
         else:
             self.config_file = config_file
             self.cache_file = os.path.join(os.path.dirname(config_file), ".catchup_cache.json")
             self.resume_file = os.path.join(os.path.dirname(config_file), ".catchup_resume.json")
+            self.api_cache_file = os.path.join(os.path.dirname(config_file), ".catchup_api_cache.json")
+        self._http = None
+        self._api_cache_lock = threading.Lock()
+        self._size_probes = {}
         self.config = self.load_config()
+        # Credentials escaped once, so '&', '+' or '/' in a password can't corrupt a URL
+        username, password = str(self.config['username']), str(self.config['password'])
+        self.auth_query = urllib.parse.urlencode({'username': username, 'password': password})
+        self.archive_auth = f"{urllib.parse.quote(username, safe='')}/{urllib.parse.quote(password, safe='')}"
         self.apply_proxy()
         self.cache = self.load_cache()
+        self.api_cache = self.load_api_cache()
         self.api_base = self.config['baseURL']
         self.archive_base = self.config.get('archiveBase', '')
         self.fetch_server_info()
@@ -60,8 +189,8 @@ class CatchupGenerator:
         if not os.path.exists(self.cache_file):
             return {}
         try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                return json_loads(f.read())
         except (json.JSONDecodeError, ValueError):
             return {}
 
@@ -70,8 +199,8 @@ class CatchupGenerator:
         if not os.path.exists(self.resume_file):
             return None
         try:
-            with open(self.resume_file, 'r') as f:
-                return json.load(f)
+            with open(self.resume_file, 'rb') as f:
+                return json_loads(f.read())
         except (json.JSONDecodeError, ValueError):
             return None
 
@@ -88,8 +217,8 @@ class CatchupGenerator:
             'started_at': datetime.now().isoformat(),
         }
         try:
-            with open(self.resume_file, 'w') as f:
-                json.dump(state, f)
+            with open(self.resume_file, 'wb') as f:
+                f.write(json_dumps(state))
         except Exception:
             pass
 
@@ -103,17 +232,44 @@ class CatchupGenerator:
 
     def save_cache(self, category_id, category_name, stream_id, stream_name, date_str, time_str):
         """Save current selections to cache"""
+        # Most recent first, used to prefetch stream lists on the next run
+        recent = [category_id] + [c for c in self.cache.get('recent_category_ids', []) if c != category_id]
         cache = {
             'category_id': category_id,
             'category_name': category_name,
             'stream_id': stream_id,
             'stream_name': stream_name,
             'date': date_str,
-            'time': time_str
+            'time': time_str,
+            'recent_category_ids': recent[:RECENT_CATEGORIES],
         }
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache, f)
+            with open(self.cache_file, 'wb') as f:
+                f.write(json_dumps(cache))
+        except Exception:
+            pass  # Silently fail on cache write errors
+
+    def load_api_cache(self):
+        """Load cached API listings (categories/streams) — entries expire after API_CACHE_TTL"""
+        if not os.path.exists(self.api_cache_file):
+            return {}
+        # Editing config.json (new server, account or proxy) invalidates everything cached
+        if os.path.getmtime(self.config_file) > os.path.getmtime(self.api_cache_file):
+            return {}
+        try:
+            with open(self.api_cache_file, 'rb') as f:
+                return json_loads(f.read())
+        except (json.JSONDecodeError, ValueError):
+            return {}
+
+    def save_api_cache(self):
+        """Write API listings to disk, dropping expired entries"""
+        now = time.time()
+        self.api_cache = {key: entry for key, entry in self.api_cache.items()
+                          if now - entry.get('fetched_at', 0) < API_CACHE_TTL}
+        try:
+            with open(self.api_cache_file, 'wb') as f:
+                f.write(json_dumps(self.api_cache))
         except Exception:
             pass  # Silently fail on cache write errors
 
@@ -125,8 +281,8 @@ class CatchupGenerator:
             sys.exit(1)
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = json_loads(f.read())
 
             # Validate required fields
             required = ['username', 'password', 'baseURL']
@@ -135,6 +291,20 @@ class CatchupGenerator:
                 print(f"⛔ Missing required fields in config: {', '.join(missing)}")
                 sys.exit(1)
 
+            # Optional, so a typo like "four" or 4.5 falls back to one connection instead of crashing
+            connections = config.get('download_connections', 1)
+            try:
+                connections = int(str(connections))
+            except ValueError:
+                connections = 0
+            if connections < 1:
+                print(f"⚠️  Invalid download_connections {config['download_connections']!r} - using 1")
+                connections = 1
+            elif connections > MAX_DOWNLOAD_CONNECTIONS:
+                print(f"⚠️  download_connections capped at {MAX_DOWNLOAD_CONNECTIONS}")
+                connections = MAX_DOWNLOAD_CONNECTIONS
+            config['download_connections'] = connections
+
             return config
         except json.JSONDecodeError as e:
             print(f"⛔ Invalid JSON in config file: {e}")
@@ -142,7 +312,7 @@ class CatchupGenerator:
 
     def fetch_server_info(self):
         """Fetch server info from the API and build dynamic base URLs"""
-        url = f"{self.config['baseURL']}?username={self.config['username']}&password={self.config['password']}"
+        url = f"{self.config['baseURL']}?{self.auth_query}"
         data = self.fetch_json(url)
 
         if not data or 'server_info' not in data:
@@ -170,22 +340,74 @@ class CatchupGenerator:
         self.archive_base = f"{base}/timeshift"
         print(f"✅ Server: {base}")
 
-    def fetch_json(self, url):
-        """Fetch JSON data from URL"""
+    def http_pool(self):
+        """Shared urllib3 connection pool, created on first use so sockets are kept alive"""
+        if self._http is None:
+            # Back off briefly on connection errors instead of failing on the first blip
+            retries = urllib3.Retry(total=2, backoff_factor=0.3)
+            # Enough kept-alive sockets per host for every parallel range, so none are discarded
+            maxsize = max(4, self.config['download_connections'])
+            proxy = self.config.get('proxy')
+            if proxy:
+                self._http = urllib3.ProxyManager(proxy, num_pools=4, maxsize=maxsize, retries=retries)
+            else:
+                self._http = urllib3.PoolManager(num_pools=4, maxsize=maxsize, retries=retries)
+        return self._http
+
+    def close(self):
+        """Release pooled connections; background prefetches and probes are daemon threads and end with the process"""
+        if self._http is not None:
+            self._http.clear()
+
+    def open_url(self, url, headers=None, timeout=10):
+        """Open a URL for streaming — pooled via urllib3 if installed, else urllib"""
+        headers = {'User-Agent': USER_AGENT, **(headers or {})}
+        if not POOLED_HTTP:
+            req = urllib.request.Request(url, headers=headers)
+            return urllib.request.urlopen(req, timeout=timeout)
+
+        response = self.http_pool().request('GET', url, headers=headers, preload_content=False, timeout=timeout)
+        if response.status >= 400:
+            # Match urllib's behaviour so callers only handle one error type
+            response.release_conn()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return response
+
+    def fetch_json(self, url, quiet=False):
+        """Fetch JSON data from URL (quiet suppresses error output, for background prefetches)"""
         try:
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+            # Channel lists compress ~5-10x; urllib3 decodes gzip itself, urllib does not
+            with self.open_url(url, headers={'Accept-Encoding': 'gzip'}) as response:
+                body = response.read()
+                if not POOLED_HTTP and response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return json_loads(body)
         except Exception as e:
-            print(f"⛔ Error fetching data: {e}")
-            print(f"   URL: {url}")
+            if not quiet:
+                print(f"⛔ Error fetching data: {e}")
+                print(f"   URL: {url}")
             return None
 
+    def fetch_json_cached(self, url, action, quiet=False):
+        """fetch_json backed by the on-disk API cache, so repeat runs skip the round-trip"""
+        # Key on server, user and action — never the password
+        key = f"{self.api_base}|{self.config['username']}|{action}"
+        entry = self.api_cache.get(key)
+        if entry and time.time() - entry.get('fetched_at', 0) < API_CACHE_TTL:
+            return entry['data']
+
+        data = self.fetch_json(url, quiet=quiet)
+        if data:
+            # Prefetch threads write here too
+            with self._api_cache_lock:
+                self.api_cache[key] = {'fetched_at': time.time(), 'data': data}
+                self.save_api_cache()
+        return data
+
     def get_categories(self):
         """Fetch available categories"""
-        url = f"{self.api_base}?username={self.config['username']}&password={self.config['password']}&action=get_live_categories"
-        data = self.fetch_json(url)
+        url = f"{self.api_base}?{self.auth_query}&action=get_live_categories"
+        data = self.fetch_json_cached(url, 'get_live_categories')
 
         if not data:
             print("⛔ Failed to load categories")
@@ -193,45 +415,64 @@ class CatchupGenerator:
 
         return data
 
-    def get_streams(self, category_id):
+    def get_streams(self, category_id, quiet=False):
         """Fetch streams for a category (only those with catchup)"""
-        url = f"{self.api_base}?username={self.config['username']}&password={self.config['password']}&action=get_live_streams&category_id={category_id}"
-        data = self.fetch_json(url)
+        url = f"{self.api_base}?{self.auth_query}&action=get_live_streams&category_id={category_id}"
+        data = self.fetch_json_cached(url, f'get_live_streams:{category_id}', quiet=quiet)
 
         if not data:
-            print("⛔ Failed to load streams")
+            if not quiet:
+                print("⛔ Failed to load streams")
             return []
 
-        # Filter only streams with catchup/archive enabled
-        return [s for s in data if s.get('tv_archive') == 1]
+        # Filter only streams with catchup/archive enabled (some providers send "1")
+        return [s for s in data if s.get('tv_archive') in (1, '1')]
+
+    def prefetch_streams(self, categories):
+        """Start fetching streams for recently used categories in the background"""
+        recent = self.cache.get('recent_category_ids') or [self.cache.get('category_id')]
+        available = {c['category_id'] for c in categories}
+        # Daemon threads, so quitting at the menu doesn't wait out a slow API's timeouts
+        return {cid: _run_in_background(self.get_streams, cid, quiet=True)
+                for cid in recent if cid in available}
 
     def is_bst(self, dt):
         """Check if date is in British Summer Time"""
-        try:
-            import zoneinfo
-            tz = zoneinfo.ZoneInfo('Europe/London')
-            localized = dt.replace(tzinfo=tz)
-            return localized.dst().total_seconds() != 0
-        except ImportError:
-            # Fallback for Python < 3.9 without zoneinfo
-            # Simple heuristic: BST is roughly last Sunday of March to last Sunday of October
-            month = dt.month
-            return 3 < month < 10 or (month == 3 and dt.day > 24) or (month == 10 and dt.day < 25)
+        if LONDON_TZ:
+            return _is_bst_hour(dt.year, dt.month, dt.day, dt.hour)
+
+        # Fallback for Python < 3.9 without zoneinfo
+        start, end = _bst_bounds(dt.year)
+        return start <= dt < end
 
     def format_start_time(self, dt):
         """Format datetime for the catchup URL"""
-        return dt.strftime("%Y-%m-%d:%H-%M")
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}:{dt.hour:02d}-{dt.minute:02d}"
 
     def sanitize_filename(self, filename):
         """Sanitize filename to remove invalid characters"""
-        # Remove or replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        # Remove any control characters
-        filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
-        return filename.strip()
+        # Replace invalid characters, drop control characters, limit length
+        return filename.translate(SANITIZE_TABLE)[:200].strip()
+
+    def needs_repair(self, input_file):
+        """Remux the file to os.devnull and report whether ffmpeg logged any warnings or errors"""
+        try:
+            result = subprocess.run(
+                [
+                    'ffmpeg',
+                    '-v', 'warning',  # Timestamp and corrupt-packet messages are warnings, not errors
+                    '-i', input_file,
+                    '-map', '0',
+                    '-c', 'copy',
+                    # The real mpegts muxer, so the DTS checks run (the null muxer skips them); nothing is kept
+                    '-f', 'mpegts', '-y', os.devnull
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except Exception:
+            return True  # If the check itself fails, fall back to always repairing
+        return result.returncode != 0 or bool(result.stderr.strip())
 
     def repair_ts_file(self, input_file):
         """Repair TS file using ffmpeg to fix corrupted or problematic streams"""
@@ -240,6 +481,12 @@ class CatchupGenerator:
             print("💡 Install with: brew install ffmpeg (macOS) or apt install ffmpeg (Ubuntu)\n")
             return False
 
+        # A pass that writes nothing to disk is much cheaper than rewriting a multi-GB file that is already fine
+        print("Checking file with ffmpeg...")
+        if not self.needs_repair(input_file):
+            print(f"✅ No repair needed: {input_file}\n")
+            return True
+
         # Generate output filename
         base_name = input_file.rsplit('.ts', 1)[0]
         temp_output = f"{base_name}_repaired.ts"
@@ -281,111 +528,270 @@ class CatchupGenerator:
                 os.remove(temp_output)
             return False
 
+    def content_length(self, url):
+        """Total size of the recording, or None if the server does not honour Range requests"""
+        # A 1-byte range reveals the full size via Content-Range and keeps the connection open.
+        # HTTP and connection errors propagate: only a response without a 206 means "no ranges"
+        with self.open_url(url, headers={'Range': 'bytes=0-0'}, timeout=30) as response:
+            if response.status != 206:
+                return None  # Closed unread - a 200 here would be the whole recording
+            response.read()  # Just the 1-byte body, so the connection can be reused
+            content_range = response.headers.get('Content-Range', '')
+            total = content_range.rsplit('/', 1)[-1]
+            return int(total) if total.isdigit() else None
+
+    def preconnect(self, url):
+        """Probe the download in the background while the user answers prompts"""
+        # Warms the pooled connection and learns the size, so the download starts immediately
+        # A daemon thread, so declining the download or pressing Ctrl+C never waits for the probe
+        self._size_probes[url] = _run_in_background(self.content_length, url)
+
+    def iter_range(self, url, start, end, buf):
+        """Read bytes start..end-1 into buf, yielding each block's length; resumes from the current offset if the connection drops"""
+        offset = start
+        attempt = 0
+        while offset < end:
+            try:
+                with self.open_url(url, headers={'Range': f'bytes={offset}-{end - 1}'}, timeout=30) as response:
+                    if response.status != 206:
+                        raise ValueError(f"Server ignored the range request (HTTP {response.status})")
+                    while offset < end:
+                        n = min(response.readinto(buf), end - offset)
+                        if n <= 0:
+                            raise ConnectionError("Connection closed before the range was complete")
+                        attempt = 0  # Only consecutive failures count towards the limit
+                        offset += n
+                        yield n
+            except RETRYABLE_ERRORS as e:
+                # A 4xx won't fix itself, and the attempts are bounded so a dead server still fails
+                if (isinstance(e, urllib.error.HTTPError) and e.code < 500) or attempt >= DOWNLOAD_RETRIES:
+                    raise
+                attempt += 1
+                print(f"\n⚠️  Connection lost ({e}) - retrying in {attempt}s")
+                time.sleep(attempt)
+
     def download_file(self, url, filename, chunk_percent=10, duration_minutes=30):
-        """Download file using wget with chunked restarts to avoid throttling"""
+        """Download file in-process with a new Range request every chunk to avoid throttling"""
         print(f"\nDownloading: {filename}")
-        print(f"Restarting every {chunk_percent}% to avoid bandwidth throttling\n")
 
-        if not shutil.which('wget'):
-            print("⛔ wget is required for downloads. Install with: brew install wget")
+        probe = self._size_probes.pop(url, None)
+        try:
+            total_size = probe.result() if probe else self.content_length(url)
+        except Exception as e:
+            print(f"⛔ Download failed: {e}")
             return False
+        if not total_size:
+            print("💡 Server does not support ranged requests - downloading in one go\n")
+            return self.download_file_direct(url, filename)
 
-        # Initialize tracking
-        chunk_num = 0
-        last_restart_percent = 0
-        total_start_time = time.time()
-        initial_size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        # Parallel ranges only for fresh downloads — a partial file is resumed sequentially
+        connections = self.config['download_connections']
+        if connections > 1 and not os.path.exists(filename):
+            return self.download_file_parallel(url, filename, total_size, connections)
 
-        download_complete = False
-
-        while not download_complete:
-            chunk_num += 1
-            target_percent = min(last_restart_percent + chunk_percent, 100)
-            chunk_start_time = time.time()
-            chunk_start_size = os.path.getsize(filename) if os.path.exists(filename) else 0
-            we_terminated = False
-
-            print(f"Chunk {chunk_num}: {last_restart_percent}% -> {target_percent}%")
-
-            # Start wget with progress output
-            if chunk_num == 1 and not os.path.exists(filename):
-                cmd = ['wget', '--progress=dot:mega', '-O', filename, url]
-            else:
-                cmd = ['wget', '--progress=dot:mega', '-c', '-O', filename, url]
+        print(f"Restarting every {chunk_percent}% to avoid bandwidth throttling\n")
 
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
+        # Initialize tracking
+        chunk_num = 0
+        total_start_time = time.monotonic()
+        initial_size = _file_size(filename)
+        downloaded = initial_size
+        buf = bytearray(DOWNLOAD_BUFFER_SIZE)
+        view = memoryview(buf)
+        last_draw = 0.0
 
-            current_percent = last_restart_percent
-            try:
-                for line in process.stdout:
-                    # Parse wget's dot progress output for percentage and speed
-                    # Format: "    50M .......... .......... .......... ..........  73% 10.2M"
-                    match = re.search(r'\s(\d+)%\s+([\d.]+[KMG]?)', line)
-                    if match:
-                        current_percent = int(match.group(1))
-                        current_speed = match.group(2)
+        try:
+            # Append so a partial file from an earlier run is resumed, like wget -c
+            with open(filename, 'ab', buffering=0) as f:
+                while downloaded < total_size:
+                    chunk_num += 1
+                    target_percent = min(downloaded * 100 // total_size + chunk_percent, 100)
+                    chunk_end = max((total_size * target_percent + 99) // 100, downloaded + 1)
+                    chunk_start_time = time.monotonic()
+                    chunk_start_size = downloaded
+
+                    print(f"Chunk {chunk_num}: {downloaded * 100 // total_size}% -> {target_percent}%")
+
+                    # Each chunk is a fresh request (resets the server's throttle) on the pooled connection
+                    for n in self.iter_range(url, downloaded, chunk_end, buf):
+                        _write_all(f, view[:n])
+                        downloaded += n
+
+                        # Redraw at most 10 times a second, but always show where a chunk ends
+                        now = time.monotonic()
+                        if now - last_draw < PROGRESS_INTERVAL and downloaded < chunk_end:
+                            continue
+                        last_draw = now
 
                         # Calculate chunk average
-                        chunk_elapsed = time.time() - chunk_start_time
-                        current_size = os.path.getsize(filename) if os.path.exists(filename) else 0
-                        chunk_downloaded = current_size - chunk_start_size
-                        chunk_avg_mbps = chunk_downloaded / chunk_elapsed / (1024 * 1024) if chunk_elapsed > 0 else 0
+                        chunk_elapsed = now - chunk_start_time
+                        chunk_avg_mbps = (downloaded - chunk_start_size) / chunk_elapsed / (1024 * 1024) if chunk_elapsed > 0 else 0
 
                         # Calculate overall average
-                        total_elapsed = time.time() - total_start_time
-                        total_downloaded = current_size - initial_size
-                        overall_avg_mbps = total_downloaded / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
+                        total_elapsed = now - total_start_time
+                        overall_avg_mbps = (downloaded - initial_size) / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
 
                         # Show progress
-                        print(f"\r  Progress: {current_percent}% | "
-                              f"Speed: {current_speed}B/s | "
+                        print(f"\r  Progress: {downloaded * 100 // total_size}% | "
                               f"Chunk avg: {chunk_avg_mbps:.1f} MB/s | "
                               f"Overall avg: {overall_avg_mbps:.1f} MB/s   ", end='', flush=True)
+                    print()  # New line
 
-                        # Check if we hit target percentage
-                        if current_percent >= target_percent and current_percent < 100:
-                            print()  # New line
-                            process.terminate()
-                            try:
-                                process.wait(timeout=2)
-                            except subprocess.TimeoutExpired:
-                                process.kill()
-                            we_terminated = True
-                            last_restart_percent = current_percent
-                            break
-
-                # Process ended - check why
-                if not we_terminated:
-                    exit_code = process.poll()
-                    if exit_code == 0 or current_percent >= 100:
-                        print()  # New line after progress
-                        download_complete = True
-                    elif exit_code is not None and exit_code != 0:
-                        print(f"\n⛔ Download failed with exit code {exit_code}")
-                        return False
-
-            except KeyboardInterrupt:
-                process.terminate()
-                current_size = os.path.getsize(filename) if os.path.exists(filename) else 0
-                print(f"\n\n⚠️  Download interrupted at {current_size / (1024 * 1024):.1f} MB")
-                print(f"💡 Resume with: wget -c -O '{filename}' '{url}'")
-                return False
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Download interrupted at {downloaded / (1024 * 1024):.1f} MB")
+            print("💡 Relaunch to resume this download")
+            return False
+        except Exception as e:
+            print(f"\n⛔ Download failed: {e}")
+            return False
 
-        # Final stats
-        final_size = os.path.getsize(filename) if os.path.exists(filename) else 0
-        total_elapsed = time.time() - total_start_time
+        # Final stats — the byte counter is the file size, no need to stat it again
+        final_size = downloaded
+        total_elapsed = time.monotonic() - total_start_time
         total_downloaded = final_size - initial_size
         overall_avg_speed = total_downloaded / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
 
         print(f"\n✅ Download complete: {filename}")
         print(f"   Size: {final_size / (1024 * 1024):.1f} MB | Time: {total_elapsed:.0f}s | Avg speed: {overall_avg_speed:.1f} MB/s")
-        print(f"   Chunks: {chunk_num} (restarted {chunk_num - 1} times)\n")
+        print(f"   Chunks: {chunk_num} (restarted {max(chunk_num - 1, 0)} times)\n")
+        return True
+
+    def download_file_parallel(self, url, filename, total_size, connections):
+        """Download disjoint byte ranges on several connections at once (for per-connection throttling)"""
+        print(f"Downloading on {connections} connections in parallel\n")
+
+        # Written to a .part file: a crash leaves a full-size file with holes, which must
+        # never be mistaken for a finished download by the resume logic
+        part_file = f"{filename}.part"
+        bounds = [total_size * i // connections for i in range(connections + 1)]
+        progress = [0] * connections
+        stop = threading.Event()
+
+        def fetch_range(index, fd):
+            start, end = bounds[index], bounds[index + 1]
+            buf = bytearray(DOWNLOAD_BUFFER_SIZE)
+            view = memoryview(buf)
+            offset = start
+            # A dropped connection re-requests only the rest of this range, so the .part file survives it
+            for n in self.iter_range(url, start, end, buf):
+                if stop.is_set():
+                    break
+                # pwrite at an explicit offset, so the writers need no shared file position or lock
+                _pwrite_all(fd, view[:n], offset)
+                offset += n
+                progress[index] = offset - start
+
+        total_start_time = time.monotonic()
+        fd = os.open(part_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        executor = ThreadPoolExecutor(max_workers=connections)
+        success = False
+        try:
+            # Reserve the whole file up front so concurrent writers don't fragment it
+            try:
+                os.posix_fallocate(fd, 0, total_size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, total_size)  # macOS, or a filesystem without fallocate
+
+            pending = [executor.submit(fetch_range, i, fd) for i in range(connections)]
+            while pending:
+                done, pending = wait(pending, timeout=PROGRESS_INTERVAL)
+                for future in done:
+                    future.result()  # Re-raise a failed range
+
+                downloaded = sum(progress)
+                total_elapsed = time.monotonic() - total_start_time
+                overall_avg_mbps = downloaded / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
+                print(f"\r  Progress: {downloaded * 100 // total_size}% | "
+                      f"Overall avg: {overall_avg_mbps:.1f} MB/s   ", end='', flush=True)
+            success = True
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Download interrupted at {sum(progress) / (1024 * 1024):.1f} MB")
+            print("💡 Relaunch to start this download again")
+        except Exception as e:
+            print(f"\n⛔ Download failed: {e}")
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+            os.close(fd)
+            if not success and os.path.exists(part_file):
+                os.remove(part_file)
+
+        if not success:
+            return False
+
+        os.replace(part_file, filename)
+        total_elapsed = time.monotonic() - total_start_time
+        overall_avg_speed = total_size / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
+        print(f"\n\n✅ Download complete: {filename}")
+        print(f"   Size: {total_size / (1024 * 1024):.1f} MB | Time: {total_elapsed:.0f}s | Avg speed: {overall_avg_speed:.1f} MB/s")
+        print(f"   Connections: {connections}\n")
+        return True
+
+    def download_file_direct(self, url, filename):
+        """Download in one streamed request, for servers that do not support ranged requests"""
+        initial_size = _file_size(filename)
+        headers = {'Range': f'bytes={initial_size}-'} if initial_size else None
+        total_start_time = time.monotonic()
+
+        try:
+            response = self.open_url(url, headers=headers, timeout=30)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and initial_size:
+                # Nothing left to fetch - the file is already complete
+                print(f"✅ Download complete: {filename}\n")
+                return True
+            print(f"⛔ Download failed: {e}")
+            return False
+        except Exception as e:
+            print(f"⛔ Download failed: {e}")
+            return False
+
+        with response:
+            # 206 means the server honoured the Range header, so append to what we have
+            resumed = bool(initial_size) and response.status == 206
+            downloaded = initial_size if resumed else 0
+            length = response.headers.get('Content-Length')
+            total_size = downloaded + int(length) if length else None
+
+            # One reusable buffer, written unbuffered: no per-chunk bytes objects or extra copy
+            buf = bytearray(DOWNLOAD_BUFFER_SIZE)
+            view = memoryview(buf)
+            last_draw = 0.0
+            try:
+                with open(filename, 'ab' if resumed else 'wb', buffering=0) as f:
+                    while True:
+                        n = response.readinto(buf)
+                        if not n:
+                            break
+                        _write_all(f, view[:n])
+                        downloaded += n
+
+                        # Redraw at most 10 times a second, not on every block
+                        now = time.monotonic()
+                        if now - last_draw < PROGRESS_INTERVAL:
+                            continue
+                        last_draw = now
+
+                        if total_size:
+                            progress = f"{downloaded * 100 // total_size}%"
+                        else:
+                            progress = f"{downloaded / (1024 * 1024):.1f} MB"
+                        total_elapsed = now - total_start_time
+                        overall_avg_mbps = (downloaded - initial_size) / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
+                        print(f"\r  Progress: {progress} | "
+                              f"Overall avg: {overall_avg_mbps:.1f} MB/s   ", end='', flush=True)
+            except KeyboardInterrupt:
+                print(f"\n\n⚠️  Download interrupted at {downloaded / (1024 * 1024):.1f} MB")
+                print("💡 Relaunch to resume this download")
+                return False
+            except Exception as e:
+                print(f"\n⛔ Download failed: {e}")
+                return False
+
+        total_elapsed = time.monotonic() - total_start_time
+        overall_avg_speed = (downloaded - initial_size) / total_elapsed / (1024 * 1024) if total_elapsed > 0 else 0
+        print(f"\n\n✅ Download complete: {filename}")
+        print(f"   Size: {downloaded / (1024 * 1024):.1f} MB | Time: {total_elapsed:.0f}s | Avg speed: {overall_avg_speed:.1f} MB/s\n")
         return True
 
     def generate_url(self, stream_id, start_datetime, duration_minutes):
@@ -396,9 +802,13 @@ class CatchupGenerator:
             print("🇬🇧 BST detected – 1 hour was subtracted from the time.")
 
         start_str = self.format_start_time(start_datetime)
-        url = f"{self.archive_base}/{self.config['username']}/{self.config['password']}/{duration_minutes}/{start_str}/{stream_id}.ts"
+        url = f"{self.archive_base}/{self.archive_auth}/{duration_minutes}/{start_str}/{stream_id}.ts"
         return url
 
+    def index_of(self, items, id_key, value):
+        """Position of the first item whose id_key equals value, or None"""
+        return next((i for i, item in enumerate(items) if item.get(id_key) == value), None)
+
     def select_from_list_interactive(self, items, title, name_key='name', default_value=None, id_key=None):
         """Interactive selection using arrow keys"""
         if not INTERACTIVE_MODE:
@@ -407,10 +817,7 @@ class CatchupGenerator:
         # Find default cursor position
         cursor_index = 0
         if default_value and id_key:
-            for i, item in enumerate(items):
-                if item.get(id_key) == default_value:
-                    cursor_index = i
-                    break
+            cursor_index = self.index_of(items, id_key, default_value) or 0
 
         # Replace | with a visual separator to avoid column splitting
         options = [item[name_key].replace('|', ' │ ') for item in items]
@@ -442,10 +849,7 @@ class CatchupGenerator:
         # Find the default item's overall index (0-based)
         default_idx = None
         if default_value and id_key:
-            for i, item in enumerate(items):
-                if item.get(id_key) == default_value:
-                    default_idx = i
-                    break
+            default_idx = self.index_of(items, id_key, default_value)
 
         offset = 0
         # Start the page that contains the default item
@@ -456,15 +860,15 @@ class CatchupGenerator:
             page = items[offset:offset + PAGE_SIZE]
             has_more = (offset + PAGE_SIZE) < len(items)
 
-            print(f"\n{title}")
-            print("-" * 60)
+            # Build the whole page first and write it in one go (no stagger over SSH)
+            lines = [f"\n{title}", "-" * 60]
             for i, item in enumerate(page):
                 overall = offset + i
                 marker = " *" if overall == default_idx else ""
-                print(f"  {i + 1}. {item[name_key]}{marker}")
+                lines.append(f"  {i + 1}. {item[name_key]}{marker}")
             if has_more:
-                print(f"  11. Show more ({len(items) - offset - PAGE_SIZE} remaining)...")
-            print()
+                lines.append(f"  11. Show more ({len(items) - offset - PAGE_SIZE} remaining)...")
+            print("\n".join(lines) + "\n")
 
             max_choice = 11 if has_more else PAGE_SIZE
             prompt = f"Select (1-{min(PAGE_SIZE, len(page))}{', 11=more' if has_more else ''})"
@@ -498,7 +902,7 @@ class CatchupGenerator:
             day = today - timedelta(days=i)
             days.append({
                 'date': day,
-                'display': f"{day.strftime('%A')} - {day.strftime('%Y-%m-%d')}"
+                'display': f"{calendar.day_name[day.weekday()]} - {day.date().isoformat()}"
             })
 
         return days
@@ -511,11 +915,9 @@ class CatchupGenerator:
             selected = self.select_from_list_interactive(days, "Select Date:", 'display')
             return selected['date']
         else:
-            print("\nSelect Date:")
-            print("-" * 60)
-            for idx, day in enumerate(days, 1):
-                print(f"  {idx}. {day['display']}")
-            print()
+            lines = ["\nSelect Date:", "-" * 60]
+            lines += [f"  {idx}. {day['display']}" for idx, day in enumerate(days, 1)]
+            print("\n".join(lines) + "\n")
 
             while True:
                 try:
@@ -547,19 +949,13 @@ class CatchupGenerator:
                     print("⛔ Please enter a time")
                     continue
 
-                # Remove any colons if user includes them
-                time_str = time_str.replace(':', '')
-
-                # Validate format
-                if len(time_str) == 3:
-                    # Handle 3-digit input like 945 as 0945
-                    time_str = '0' + time_str
-                elif len(time_str) != 4:
+                # Accepts an optional colon and 3-digit input like 945 for 09:45
+                match = TIME_RE.fullmatch(time_str)
+                if not match:
                     print("⛔ Invalid format. Please enter 4 digits (e.g., 1745)")
                     continue
 
-                hours = int(time_str[:2])
-                minutes = int(time_str[2:])
+                hours, minutes = int(match[1]), int(match[2])
 
                 if hours > 23 or minutes > 59:
                     print("⛔ Invalid time. Hours must be 00-23, minutes 00-59")
@@ -567,8 +963,6 @@ class CatchupGenerator:
 
                 return hours, minutes
 
-            except ValueError:
-                print("⛔ Invalid format. Please enter numbers only (e.g., 1745)")
             except KeyboardInterrupt:
                 print("\n👋 Goodbye!")
                 sys.exit(0)
@@ -616,6 +1010,9 @@ class CatchupGenerator:
         if INTERACTIVE_MODE:
             print("💡 Use arrow keys to navigate, Enter to select, q to quit\n")
 
+        # Load streams for recent categories while the user is choosing
+        prefetched = self.prefetch_streams(categories)
+
         # Select category (with cached default)
         selected_category = self.select_from_list_interactive(
             categories,
@@ -627,8 +1024,11 @@ class CatchupGenerator:
 
         print(f"\n✅ Selected: {selected_category['category_name']}")
 
-        # Get streams
+        # Get streams — a finished prefetch leaves them in the API cache
         print("Loading streams with catchup...")
+        future = prefetched.pop(selected_category['category_id'], None)
+        if future:
+            wait([future], timeout=10)
         streams = self.get_streams(selected_category['category_id'])
 
         if not streams:
@@ -654,7 +1054,7 @@ class CatchupGenerator:
 
         # Get date from menu (last 7 days)
         selected_date = self.select_date()
-        print(f"\n✅ Selected: {selected_date.strftime('%A, %Y-%m-%d')}")
+        print(f"\n✅ Selected: {calendar.day_name[selected_date.weekday()]}, {selected_date.date().isoformat()}")
 
         # Get time in 24h format (with cached default if same stream)
         default_time = None
@@ -670,7 +1070,7 @@ class CatchupGenerator:
             category_name=selected_category['category_name'],
             stream_id=selected_stream['stream_id'],
             stream_name=selected_stream['name'],
-            date_str=selected_date.strftime('%Y-%m-%d'),
+            date_str=selected_date.date().isoformat(),
             time_str=f"{hours:02d}{minutes:02d}"
         )
 
@@ -698,29 +1098,21 @@ class CatchupGenerator:
         # Generate URL
         print("\n" + "=" * 60)
         url = self.generate_url(selected_stream['stream_id'], start_dt, duration)
+        self.preconnect(url)
         print("Generated Catchup URL:")
         print("=" * 60)
         print(url)
         print("=" * 60)
 
         # Copy to clipboard (optional, best effort)
-        try:
-            if sys.platform == 'darwin':  # macOS
-                subprocess.run(['pbcopy'], input=url.encode(), check=True)
+        if CLIPBOARD_CMD:
+            try:
+                subprocess.run(CLIPBOARD_CMD, input=url.encode(), check=True)
                 print("✅ URL copied to clipboard!")
-            elif sys.platform == 'linux':  # Linux
-                # Try xclip first, then xsel
-                try:
-                    subprocess.run(['xclip', '-selection', 'clipboard'], input=url.encode(), check=True)
-                    print("✅ URL copied to clipboard!")
-                except FileNotFoundError:
-                    try:
-                        subprocess.run(['xsel', '--clipboard', '--input'], input=url.encode(), check=True)
-                        print("✅ URL copied to clipboard!")
-                    except FileNotFoundError:
-                        print("💡 Install xclip or xsel for clipboard support")
-        except Exception:
-            pass
+            except Exception:
+                pass
+        elif sys.platform == 'linux':
+            print("💡 Install xclip, xsel or wl-clipboard for clipboard support")
 
         # Ask if user wants to download
         print()
@@ -728,6 +1120,7 @@ class CatchupGenerator:
             try:
                 download_choice = input("Do you want to download this file? (y/n) [y]: ").strip().lower()
                 if download_choice == 'n':
+                    self._size_probes.pop(url, None)  # Discard the probe; its thread ends with the process
                     print("👋 Goodbye!")
                     return
                 elif download_choice == '' or download_choice == 'y':
@@ -735,15 +1128,16 @@ class CatchupGenerator:
                 else:
                     print("⛔ Please enter 'y' or 'n'")
             except KeyboardInterrupt:
+                self._size_probes.pop(url, None)
                 print("\n👋 Goodbye!")
                 return
 
         # Generate default filename
         # Format: StreamName_DayOfWeek_Date_Time.ts
         stream_name = self.sanitize_filename(selected_stream['name'])
-        day_of_week = start_dt.strftime('%A')
-        date_str = start_dt.strftime('%Y-%m-%d')
-        time_str = start_dt.strftime('%H%M')
+        day_of_week = calendar.day_name[start_dt.weekday()]
+        date_str = start_dt.date().isoformat()
+        time_str = f"{start_dt.hour:02d}{start_dt.minute:02d}"
         default_filename = f"{stream_name}_{day_of_week}_{date_str}_{time_str}.ts"
 
         # Ask for filename
@@ -767,7 +1161,7 @@ class CatchupGenerator:
             filename=filename,
             category_name=selected_category['category_name'],
             stream_name=selected_stream['name'],
-            date_str=selected_date.strftime('%Y-%m-%d'),
+            date_str=selected_date.date().isoformat(),
             time_str=f"{hours:02d}{minutes:02d}",
             duration=duration,
         )
@@ -783,7 +1177,10 @@ class CatchupGenerator:
 
 def main():
     generator = CatchupGenerator()
-    generator.run_interactive()
+    try:
+        generator.run_interactive()
+    finally:
+        generator.close()
 
 
 if __name__ == "__main__":
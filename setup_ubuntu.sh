@@ -1,5 +1,5 @@
 #!/bin/bash
-# Setup script for Ubuntu — creates venv with simple-term-menu
+# Setup script for Ubuntu — creates venv with simple-term-menu and urllib3
 # Run once after cloning or moving the directory: bash setup_ubuntu.sh
 
 set -e
@@ -10,8 +10,8 @@ VENV_DIR="$SCRIPT_DIR/venv"
 echo "Creating virtual environment at $VENV_DIR..."
 python3 -m venv "$VENV_DIR"
 
-echo "Installing simple-term-menu..."
-"$VENV_DIR/bin/pip" install simple-term-menu
+echo "Installing simple-term-menu and urllib3..."
+"$VENV_DIR/bin/pip" install simple-term-menu urllib3
 
 echo ""
 echo "✅ Done. Run the app with:"